@@ -1,46 +1,121 @@
-import logging
 import os
 import re
+import shutil
 import string
 import sys
 
 import bibtexparser
 from bibtexparser.model import Field
 
+_SHORT_PROC_RE = re.compile(r"^Proc\. of \{[a-zA-Z-]+\}(?:/\{[a-zA-Z-]+\})?'\d{2}$")
+_LONG_PROC_RE = re.compile(r"^Proceedings of .+ \(\{[a-zA-Z-]+\}(?:/\{[a-zA-Z-]+\})?'\d{2}\)$")
+_PROC_KEY_RE = re.compile(r"\{[a-zA-Z-]+\}(?:/\{[a-zA-Z-]+\})?'\d{2}")
+_ARXIV_RE = re.compile(r'arXiv:\d+\.\d+(?:\s\[\w+\])?')
+
+# Deletion tables for key derivation; str.translate is a single C-level pass
+# where a tiny re.sub pays the full regex-engine overhead per call. The tables
+# only cover latin-1, which suffices for _KEEP_ALNUM because _PROC_KEY_RE
+# matches are ASCII by construction; arbitrary author/venue text goes through
+# _ascii_alpha, which also drops any characters beyond the table's range.
+_KEEP_ALNUM = str.maketrans('', '', ''.join(chr(c) for c in range(256) if chr(c) not in string.ascii_letters + string.digits))
+_KEEP_ALPHA = str.maketrans('', '', ''.join(chr(c) for c in range(256) if chr(c) not in string.ascii_letters))
+
+# Fields to keep, in the order they should appear in the cleaned entry; the frozensets give O(1) membership tests
+_PROCEEDINGS_FIELDS = ('title', 'booktitle', 'year', 'notes')
+_PROCEEDINGS_FIELDS_SET = frozenset(_PROCEEDINGS_FIELDS)
+_ENTRY_FIELDS = ('title', 'author', 'editor', 'booktitle', 'crossref', 'journal', 'volume', 'number', 'pages', 'year', 'note')
+_ENTRY_FIELDS_SET = frozenset(_ENTRY_FIELDS)
+# With a crossref, year/booktitle/journal come from the referenced proceedings entry instead
+_ENTRY_FIELDS_CROSSREF = tuple(f for f in _ENTRY_FIELDS if f not in ('year', 'booktitle', 'journal'))
+_ENTRY_FIELDS_CROSSREF_SET = frozenset(_ENTRY_FIELDS_CROSSREF)
+
+
+def _norm_ws(s: str) -> str:
+    # str.split() collapses runs of any whitespace (including linebreaks) and strips the ends in one pass
+    return ' '.join(s.split())
+
+
+def _ascii_alpha(s: str) -> str:
+    # Keep only ASCII letters, so derived citation keys stay portable across
+    # BibTeX toolchains; the common all-ASCII case is a single translate
+    s = s.translate(_KEEP_ALPHA)
+    return s if s.isascii() else s.encode('ascii', 'ignore').decode()
+
+
+def _rewrite_title(value: str) -> str:
+    # Rephrase a title
+    # - to upper case first letter if word length > 3
+    # - to surround words with {} if other letters are capitalized than the first one
+    title = []
+    for w, word in enumerate(value.split(' ')):
+        if '{' in word or '}' in word:
+            title.append(word)
+            continue
+        rest = word[1:]
+        if rest != rest.lower() and '-' not in word:
+            if word[-1] == ':':
+                title.append("{" + word[:-1] + "}:")
+            else:
+                title.append("{" + word + "}")
+        elif w == 0 or len(word) > 3:
+            title.append(word.capitalize())
+        else:
+            title.append(word)
+    return ' '.join(title)
+
+
+def _looks_normalized(value: str) -> bool:
+    # Fast check for values already in "A. Einstein and B. Johnson" form, so
+    # the full rewrite (and its remark) only runs when something would change.
+    # Must only return True when the rewrite would be a no-op: the rewrite
+    # collapses whitespace, reorders comma-separated names and drops
+    # abbreviated middle names, so any of those marks the value as dirty.
+    if ',' in value or value != _norm_ws(value):
+        return False
+    for person in value.split(' and '):
+        if len(person) < 3 or not person[0].isupper() or person[1] != '.' or person[2] != ' ':
+            return False
+        if '.' in person[3:]:
+            return False
+    return True
+
 
 class BibTexCleaner:
     
-    def __init__(self, file: str, use_short: bool = False, replace_keys: bool = False):
+    def __init__(self, file: str, use_short: bool = False, replace_keys: bool = False, verbose: bool = False):
         self.file = file
         self.use_short = use_short
         self.replace_keys = replace_keys
-        
-        self._setup_logger()
+        self.verbose = verbose
+        # use_short is fixed for the run, so bind its pattern and template once here
+        # instead of re-branching on it inside the cleaning loops
+        self._proc_title_re = _SHORT_PROC_RE if use_short else _LONG_PROC_RE
+        self._proc_template = self._get_proceedings_template()
+        self._modified = False
+
+        self._setup_log()
         self._read()
         self._clean_proceedings()
         self._clean_entries()
         self._write()
-    
-    def _setup_logger(self):
-        self.logger = logging.getLogger('bibtext-cleaner')
-        self.logger.setLevel(logging.DEBUG)
-        
-        _file = os.path.join('files', 'remarks.log')
-        if os.path.exists(_file):
-            os.remove(_file)
-        
-        file_handler = logging.FileHandler(_file)
-        self.logger.addHandler(file_handler)
-        
-        console_handler = logging.StreamHandler()
-        self.logger.addHandler(console_handler)
-        
+
+    def _setup_log(self):
+        # A plain buffered file handle; the logging machinery (records, handler
+        # locks, formatting) is pure overhead for a write-once remarks file
+        self._log = open(os.path.join('files', 'remarks.log'), 'w', encoding='utf-8', buffering=65536)
+
+    def _info(self, msg):
+        self._log.write(msg)
+        self._log.write('\n')
+        if self.verbose:
+            print(msg, file=sys.stderr)
+
     def _read(self):
         self.library = bibtexparser.parse_file(self.file)
-        self.logger.info(f"Parsed {len(self.library.blocks)} blocks, including:\n\t{len(self.library.entries)} entries\n\t{len(self.library.comments)} comments\n\t{len(self.library.strings)} strings and\n\t{len(self.library.preambles)} preambles")
+        self._info(f"Parsed {len(self.library.blocks)} blocks, including:\n\t{len(self.library.entries)} entries\n\t{len(self.library.comments)} comments\n\t{len(self.library.strings)} strings and\n\t{len(self.library.preambles)} preambles")
         
         if len(self.library.failed_blocks) > 0:
-            self.logger.info(f"Some blocks ({len(self.library.failed_blocks)}) failed to parse. Check the entries of 'library.failed_blocks'.")
+            self._info(f"Some blocks ({len(self.library.failed_blocks)}) failed to parse. Check the entries of 'library.failed_blocks'.")
         
     def _get_proceedings_template(self):
         if self.use_short:
@@ -62,186 +137,220 @@ class BibTexCleaner:
         self.proceedings_key_updates = dict()
 
         for entry in self.proceedings:
-            self.logger.info(f"\nChecking entry with key '{entry.key}':")
-            
-            # Rephrase title and booktitle to remove linebreaks
-            for field in ['title', 'booktitle']:
-                entry.fields_dict[field].value = re.sub(r"\s+", ' ', entry.fields_dict[field].value.replace('\n', ' ')).strip()
-            
+            # Buffer the remarks and emit them as a single record per entry
+            msgs = [f"\nChecking entry with key '{entry.key}':"]
+            fd = entry.fields_dict
+
+            # Rephrase title and booktitle to remove linebreaks; booktitle usually
+            # mirrors title exactly, so reuse the normalized string instead of a second pass
+            raw_title = fd['title'].value
+            raw_booktitle = fd['booktitle'].value
+            title_value = _norm_ws(raw_title)
+            booktitle_value = title_value if raw_booktitle == raw_title else _norm_ws(raw_booktitle)
+            if title_value != raw_title:
+                fd['title'].value = title_value
+                self._modified = True
+            if booktitle_value != raw_booktitle:
+                fd['booktitle'].value = booktitle_value
+                self._modified = True
+
             # Check that title and booktitle are equal
-            if entry.fields_dict['title'].value != entry.fields_dict['booktitle'].value:
-                self.logger.info("\tTitle and booktitle are not equal, please rephrase to have them matching.")
-                
+            if fd['title'].value != fd['booktitle'].value:
+                msgs.append("\tTitle and booktitle are not equal, please rephrase to have them matching.")
+
             # Check that title and booktitle are in the right format
-            if self.use_short:
-                pattern = r"^Proc\. of \{[a-zA-Z-]+\}(?:/\{[a-zA-Z-]+\})?'\d{2}$"
-            else:
-                pattern = r"^Proceedings of .+ \(\{[a-zA-Z-]+\}(?:/\{[a-zA-Z-]+\})?'\d{2}\)$"
-            if not re.match( pattern, entry.fields_dict['title'].value):
-                self.logger.info(f"\tThe title is not in the right format, it is expected to be equivalent to {self._get_proceedings_template()}")
-                
+            if not self._proc_title_re.match(fd['title'].value):
+                msgs.append(f"\tThe title is not in the right format, it is expected to be equivalent to {self._proc_template}")
+
             # Rephrase key to: <conference abbreviation><year>
             if self.replace_keys:
-                match = re.search(r"\{[a-zA-Z-]+\}(?:/\{[a-zA-Z-]+\})?'\d{2}", entry.fields_dict['title'].value)
+                match = _PROC_KEY_RE.search(fd['title'].value)
                 if not match:
-                    self.logger.info("\tThe title is not in the right format, it is expected to contain `<ConfAbbrev>'<YearAbbrev>`")
+                    msgs.append("\tThe title is not in the right format, it is expected to contain `<ConfAbbrev>'<YearAbbrev>`")
                 else:
-                    correct_key = re.sub(r'[^a-zA-Z0-9]', '', match.group(0)).lower()
+                    correct_key = match.group(0).translate(_KEEP_ALNUM).lower()
                     if correct_key != entry.key:
                         self.proceedings_key_updates[entry.key] = correct_key
                         entry.key = correct_key
-                        self.logger.info(f"\tRephrased key: {entry.key}")
-            
+                        self._modified = True
+                        msgs.append(f"\tRephrased key: {entry.key}")
+
             # Remove all fields except the chosen ones, and reorder the fields according to the ordering of the chosen fields
-            chosen_fields = ['title', 'booktitle', 'year', 'notes']
-            removed_fields = [field.key for field in entry.fields if field.key not in chosen_fields]
-            entry.fields = [entry.fields_dict[field] for field in chosen_fields if field in entry.fields_dict]
-            if len(removed_fields) > 0:
-                self.logger.info(f"\tRemoved fields: {removed_fields}")
-            
-            self.logger.info("\tDone.")
-            
+            # fd doubles as the present-field lookup: in the common already-clean case a
+            # cheap any() shows nothing is removed and the report list is never built
+            fields_removed = any(key not in _PROCEEDINGS_FIELDS_SET for key in fd)
+            new_fields = [fd[field] for field in _PROCEEDINGS_FIELDS if field in fd]
+            if new_fields != entry.fields:
+                entry.fields = new_fields
+                self._modified = True
+            if fields_removed:
+                msgs.append(f"\tRemoved fields: {[key for key in fd if key not in _PROCEEDINGS_FIELDS_SET]}")
+
+            msgs.append("\tDone.")
+            self._info('\n'.join(msgs))
+
+        # Built after the loop so renamed keys are final; used for O(1) crossref lookups in _clean_entries
+        self._proceedings_keys = {proceeding.key for proceeding in self.proceedings}
+
     def _clean_entries(self):
+        # Prime the per-prefix suffix counters from existing keys in one pass, so
+        # pre-existing '<prefix><letter>' suffixes are respected when enumerating
+        self._key_suffix_counter = dict()
+        if self.replace_keys:
+            for key in (i.key for i in self.library.entries):
+                if key and 'a' <= key[-1] <= 'z':
+                    count = ord(key[-1]) - ord('a') + 1
+                    if count > self._key_suffix_counter.get(key[:-1], 0):
+                        self._key_suffix_counter[key[:-1]] = count
+
         for e, entry in enumerate([entry for entry in self.library.entries if entry.entry_type != 'proceedings']):
-            self.logger.info(f"\nChecking entry with key '{entry.key}':")
-            
-            # Rephrase title to remove linebreaks
-            entry.fields_dict['title'].value = re.sub(r"\s+", ' ', entry.fields_dict['title'].value.replace('\n', ' ')).strip()
-            
-            # Rephrase title 
-            # - to upper case first letter if word length > 3
-            # - to surround words with {} if other letters are capitalized than the first one
-            title = []
-            for w, word in enumerate(entry.fields_dict['title'].value.split(' ')):
-                if '{' not in word and '}' not in word:
-                    if word[1:].lower() != word[1:] and '-' not in word:
-                        if word[-1] == ':':
-                            title.append("{" + word[:-1] + "}" + word[-1])
-                        else:
-                            title.append("{" + word + "}")
-                    elif w == 0 or len(word) > 3:
-                        title.append(word.capitalize())
-                    else:
-                        title.append(word)
-                else:
-                    title.append(word)
-            entry.fields_dict['title'].value = ' '.join(title)
-            self.logger.info(f"Rephrased title: {entry.fields_dict['title'].value}")
-            
+            # Buffer the remarks and emit them as a single record per entry
+            msgs = [f"\nChecking entry with key '{entry.key}':"]
+            fd = entry.fields_dict
+
+            # Rephrase title to remove linebreaks, fix casing and brace-protect capitalized words
+            old_title = fd['title'].value
+            fd['title'].value = _rewrite_title(_norm_ws(old_title))
+            if fd['title'].value != old_title:
+                self._modified = True
+            msgs.append(f"Rephrased title: {fd['title'].value}")
+
             # Rephrase authors: "Albert Einstein and Boris Johnson" -> "A. Einstein and B. Johnson"
-            for people in ['editor', 'author']:
-                if people in entry.fields_dict and re.match(r'[A-Z]\.\s[A-Za-z-]+(?:\sand\s[A-Z]\.\s[A-Za-z])*', entry.fields_dict[people].value) != entry.fields_dict[people].value:
-                    original_peoples = list(person for person in re.sub(r"\s+", ' ', entry.fields_dict[people].value.replace('\n', '')).split(' and '))
+            for people in ('editor', 'author'):
+                if people in fd and not _looks_normalized(fd[people].value):
+                    original_peoples = list(person for person in _norm_ws(fd[people].value).split(' and '))
                     if len(original_peoples) > 1 or len(original_peoples[0].split(' ')) > 1:
                         peoples = []
                         for original_person in original_peoples:
                             if ',' in original_person:
-                                original_person = original_person.split(',')
-                                original_person = [original_person[-1].strip(), original_person[0].strip()]
+                                split = original_person.split(',')
+                                parts = [split[-1].strip(), split[0].strip()]
                             else:
-                                original_person = original_person.split(' ')
-                                for n, name in enumerate(original_person):
-                                    if n>0 and '.' in name:
-                                        original_person[n] = ''
-                                original_person = [x.strip() for x in original_person if x != '']
-                            peoples.append(' '.join([f"{original_person[0][0]}.",] + original_person[1:]))
-                            
-                        entry.fields_dict[people].value = ' and '.join(peoples)
-                        self.logger.info(f"\tRephrased {people}: {entry.fields_dict[people].value}")
-                
+                                # Drop abbreviated middle names in the same pass that splits the tokens
+                                parts = [name for n, name in enumerate(original_person.split(' ')) if name and not (n > 0 and '.' in name)]
+                            peoples.append(' '.join([f"{parts[0][0]}.", *parts[1:]]))
+
+                        value = ' and '.join(peoples)
+                        if value != fd[people].value:
+                            fd[people].value = value
+                            self._modified = True
+                        msgs.append(f"\tRephrased {people}: {fd[people].value}")
+
             # Rephrase arXiv papers
-            if 'journal' in entry.fields_dict and entry.fields_dict['journal'].value == 'CoRR':
-                entry.fields_dict['journal'].value = f"arXiv:{entry.fields_dict['volume'].value.replace('abs/', '')}"
+            if 'journal' in fd and fd['journal'].value == 'CoRR':
+                fd['journal'].value = f"arXiv:{fd['volume'].value.replace('abs/', '')}"
                 entry.fields = [field for field in entry.fields if field.key != 'volume']
-                self.logger.info(f"\tRephrased journal: {entry.fields_dict['journal'].value}\n\tRemoved volume")
-            
-            elif 'journal' in entry.fields_dict and 'arxiv' in entry.fields_dict['journal'].value.lower():
-                if not re.match(r'arXiv:\d+\.\d+(?:\s\[\w+\])?', entry.fields_dict['journal'].value):
-                    for word in entry.fields_dict['journal'].value.split(' '):
+                fd = entry.fields_dict
+                self._modified = True
+                msgs.append(f"\tRephrased journal: {fd['journal'].value}\n\tRemoved volume")
+
+            elif 'journal' in fd and 'arxiv' in fd['journal'].value.lower():
+                if not _ARXIV_RE.match(fd['journal'].value):
+                    for word in fd['journal'].value.split(' '):
                         if ':' in word:
                             break
-                    entry.fields_dict['journal'].value = word
-                    self.logger.info(f"\tRephrased journal: {entry.fields_dict['journal'].value}")
-                
-            elif 'eprint' in entry.fields_dict and entry.fields_dict['archivePrefix'].value == 'arXiv':
-                entry.fields.append(Field(key='journal', value=f"arXiv:{entry.fields_dict['eprint'].value}"))
-                if 'primaryClass' in entry.fields_dict:
-                    entry.fields_dict['journal'].value += f" [{entry.fields_dict['primaryClass'].value}]"
-                entry.fields = [field for field in entry.fields if field.key not in ['eprint', 'archivePrefix', 'primaryClass']]
-                self.logger.info(f"\tRephrased journal: {entry.fields_dict['journal'].value}\n\tRemoved eprint, archivePrefix, primaryClass")
-                
+                    fd['journal'].value = word
+                    self._modified = True
+                    msgs.append(f"\tRephrased journal: {fd['journal'].value}")
+
+            elif 'eprint' in fd and fd['archivePrefix'].value == 'arXiv':
+                entry.fields.append(Field(key='journal', value=f"arXiv:{fd['eprint'].value}"))
+                if 'primaryClass' in fd:
+                    entry.fields[-1].value += f" [{fd['primaryClass'].value}]"
+                entry.fields = [field for field in entry.fields if field.key not in ('eprint', 'archivePrefix', 'primaryClass')]
+                fd = entry.fields_dict
+                self._modified = True
+                msgs.append(f"\tRephrased journal: {fd['journal'].value}\n\tRemoved eprint, archivePrefix, primaryClass")
+
             # Rephrase HAL papers
-            if 'journal' in entry.fields_dict and 'hal' in entry.fields_dict['journal'].value:
-                for word in entry.fields_dict['journal'].value.split(' '):
+            if 'journal' in fd and 'hal' in fd['journal'].value:
+                for word in fd['journal'].value.split(' '):
                     if '-' in word:
                         break
-                entry.fields_dict['journal'].value = word
-                self.logger.info(f"\tRephrased journal: {entry.fields_dict['journal'].value}")
-                
+                if word != fd['journal'].value:
+                    fd['journal'].value = word
+                    self._modified = True
+                msgs.append(f"\tRephrased journal: {fd['journal'].value}")
+
             # Reset key to: <lastname of first author>-<conference or journal abbreviation><year><enumeration>
-            peoples = entry.fields_dict['author'].value if 'author' in entry.fields_dict else entry.fields_dict['editor'].value
+            peoples = fd['author'].value if 'author' in fd else fd['editor'].value
             first_author = peoples.split(' and ')[0].split(' ')[-1]
             
             # replace all letters from first_author that are none alphabetic
             if self.replace_keys:
-                first_author = re.sub(r'[^a-zA-Z]', '', first_author)
+                first_author = _ascii_alpha(first_author)
                 
                 published = ''
-                if 'journal' in entry.fields_dict:
-                    published = entry.fields_dict['journal'].value.split(':')[0] 
-                elif 'crossref' in entry.fields_dict:
-                    published = entry.fields_dict['crossref'].value
+                if 'journal' in fd:
+                    published = fd['journal'].value.split(':')[0]
+                elif 'crossref' in fd:
+                    published = fd['crossref'].value
                 else:
                     published = 'XXX'
-                published = re.sub(r'[^a-zA-Z]', '', published)
-                
+                published = _ascii_alpha(published)
+
                 year = ''
-                if 'crossref' in entry.fields_dict:
+                if 'crossref' in fd:
                     # Check if crossref has to be updated due to changed key of proceeding
-                    if entry.fields_dict['crossref'].value in self.proceedings_key_updates:
-                        self.logger.info(f"\tCrossref has been updated from '{entry.fields_dict['crossref'].value}' to '{self.proceedings_key_updates[entry.fields_dict['crossref'].value]}' due to an update of the according proceedings key.")
-                        entry.fields_dict['crossref'].value = self.proceedings_key_updates[entry.fields_dict['crossref'].value]
-                    
+                    if fd['crossref'].value in self.proceedings_key_updates:
+                        msgs.append(f"\tCrossref has been updated from '{fd['crossref'].value}' to '{self.proceedings_key_updates[fd['crossref'].value]}' due to an update of the according proceedings key.")
+                        fd['crossref'].value = self.proceedings_key_updates[fd['crossref'].value]
+                        self._modified = True
+
                     # Check crossref exists
-                    if entry.fields_dict['crossref'].value not in [proceeding.key for proceeding in self.proceedings]:
-                        self.logger.info(f"\tCrossref {entry.fields_dict['crossref'].value} not found in proceedings. Please add it according to the template:{self._get_proceedings_template()}")
-                    year = entry.fields_dict['crossref'].value[-2:]
-                
+                    if fd['crossref'].value not in self._proceedings_keys:
+                        msgs.append(f"\tCrossref {fd['crossref'].value} not found in proceedings. Please add it according to the template:{self._proc_template}")
+                    year = fd['crossref'].value[-2:]
+
                 else:
-                    if 'year' in entry.fields_dict:
-                        year = entry.fields_dict['year'].value[-2:] 
+                    if 'year' in fd:
+                        year = fd['year'].value[-2:]
                     else:
                         year = ''
                 
                 correct_key = f"{first_author}-{published}{year}".lower()
                 
                 if not entry.key.startswith(correct_key):
-                    same_keys = sorted([i.key for i in self.library.entries if i.key.startswith(correct_key) and i.key != entry.key])
-                    correct_key += chr(ord(same_keys[-1][-1])+1) if len(same_keys)>0 else 'a'
-                
-                    entry.key = correct_key
-                    self.logger.info(f"\tRephrased key: {entry.key}")
+                    count = self._key_suffix_counter.get(correct_key, 0)
+                    self._key_suffix_counter[correct_key] = count + 1
+
+                    entry.key = correct_key + chr(ord('a') + count)
+                    self._modified = True
+                    msgs.append(f"\tRephrased key: {entry.key}")
             
             # Check if proceeding has been extracted and used via crossref
-            if entry.entry_type == 'inproceedings' and 'booktitle' in entry.fields_dict:
-                self.logger.info(f"\tProceeding '{entry.fields_dict['booktitle'].value}' is hardcoded. Please extract it according to the template:{self._get_proceedings_template()}")
-            
+            if entry.entry_type == 'inproceedings' and 'booktitle' in fd:
+                msgs.append(f"\tProceeding '{fd['booktitle'].value}' is hardcoded. Please extract it according to the template:{self._proc_template}")
+
             # Remove all fields except the chosen ones, and reorder the fields according to the ordering of the chosen fields
-            chosen_fields = ['title', 'author', 'editor', 'booktitle', 'crossref', 'journal', 'volume', 'number', 'pages', 'year', 'note']
-            if 'crossref' in entry.fields_dict:
-                chosen_fields = [f for f in chosen_fields if f not in ['year', 'booktitle', 'journal']]
-            removed_fields = [field.key for field in entry.fields if field.key not in chosen_fields]
-            entry.fields = [entry.fields_dict[field] for field in chosen_fields if field in entry.fields_dict] # TODO remove year if crossref
-            if len(removed_fields) > 0:
-                self.logger.info(f"\tRemoved fields: {removed_fields}")
+            if 'crossref' in fd:
+                chosen_fields, chosen_fields_set = _ENTRY_FIELDS_CROSSREF, _ENTRY_FIELDS_CROSSREF_SET
+            else:
+                chosen_fields, chosen_fields_set = _ENTRY_FIELDS, _ENTRY_FIELDS_SET
+            # fd doubles as the present-field lookup: in the common already-clean case a
+            # cheap any() shows nothing is removed and the report list is never built
+            fields_removed = any(key not in chosen_fields_set for key in fd)
+            new_fields = [fd[field] for field in chosen_fields if field in fd]
+            if new_fields != entry.fields:
+                entry.fields = new_fields
+                self._modified = True
+            if fields_removed:
+                msgs.append(f"\tRemoved fields: {[key for key in fd if key not in chosen_fields_set]}")
                 
-            self.logger.info("\tDone.")
+            msgs.append("\tDone.")
+            self._info('\n'.join(msgs))
                 
         
     def _write(self):
-        bibtexparser.write_file(self.file.split(".")[0] + "_cleaned.bib", self.library)
+        out_file = os.path.splitext(self.file)[0] + "_cleaned.bib"
+        if self._modified:
+            bibtexparser.write_file(out_file, self.library)
+        else:
+            # Nothing changed: keep the original bytes instead of re-serializing the whole model
+            shutil.copyfile(self.file, out_file)
+        self._log.close()
             
 
 if __name__ == '__main__':
     nargs = len(sys.argv)
-    BibTexCleaner('files/references.bib', use_short='use_short' in sys.argv, replace_keys='replace_keys' in sys.argv)
+    BibTexCleaner('files/references.bib', use_short='use_short' in sys.argv, replace_keys='replace_keys' in sys.argv, verbose='verbose' in sys.argv)